@@ -9,16 +9,28 @@ def test_get_well_position():
     assert utils.get_well_position(plate, "A01") == 1
     assert utils.get_well_position(plate, "B01") == 2
     assert utils.get_well_position(plate, "B04") == 11
+    assert utils.get_well_position(plate, "B4") == 11
 
     trough = Trough("trough", 2, 3, min_volume=0, max_volume=50)
     assert utils.get_well_position(trough, "A01") == 1
     assert utils.get_well_position(trough, "B01") == 2
     assert utils.get_well_position(trough, "A02") == 3
     assert utils.get_well_position(trough, "A03") == 5
+    assert utils.get_well_position(trough, "B3") == 6
 
     with pytest.raises(ValueError, match="not an alphanumeric well ID"):
         utils.get_well_position(trough, "A-3")
 
+    # The EVO counts all virtual rows, also beyond the lettered ones
+    trough = Trough("trough", 30, 2, min_volume=0, max_volume=50)
+    assert utils.get_well_position(trough, "A02") == 31
+    assert utils.get_well_position(trough, "Z2") == 56
+
+    # Plates with more rows than row IDs only count the row IDs
+    plate = Labware("plate", 30, 2, min_volume=0, max_volume=50)
+    assert utils.get_well_position(plate, "A02") == 27
+    assert utils.get_well_position(plate, "Z02") == 52
+
     # Currently not implemented at the Labware level:
     # megaplate = Labware("mplate", 50, 3, min_volume=0, max_volume=50)
     # assert utils.get_well_position(megaplate, "AA2") == 51
@@ -589,6 +589,40 @@ class TestEvoWorklist:
         )
         return
 
+    def test_transfer_zero_volumes(self) -> None:
+        A = Labware("A", 3, 2, min_volume=0, max_volume=1000, initial_volumes=500)
+        B = Labware("B", 3, 2, min_volume=0, max_volume=1000)
+        with EvoWorklist() as wl:
+            wl.transfer(A, "A01", B, "A01", 100, label="one")
+            wl.transfer(A, A.wells, B, B.wells, np.zeros((3, 2)), label="nothing")
+            assert wl[-1] == "C;nothing"
+            assert wl.count("W1;") == 1
+        # the history of previous operations is retained
+        assert [label for label, _ in A.history] == ["initial", "one"]
+        assert [label for label, _ in B.history] == ["initial", "one"]
+        return
+
+    def test_transfer_chain_within_labware(self) -> None:
+        A = Labware("A", 3, 1, min_volume=0, max_volume=1000, initial_volumes=[100, 0, 0])
+
+        with EvoWorklist() as wl:
+            # B01 must receive liquid before it can be aspirated
+            wl.transfer(A, ["A01", "B01"], A, ["B01", "C01"], 50, label="chain")
+            assert wl == [
+                "C;chain",
+                "A;A;;;1;;50.00;;;;",
+                "D;A;;;2;;50.00;;;;",
+                "W1;",
+                "A;A;;;2;;50.00;;;;",
+                "D;A;;;3;;50.00;;;;",
+                "W1;",
+            ]
+
+        assert len(A.history) == 2
+        np.testing.assert_array_equal(A.volumes, [[50], [0], [50]])
+        assert A.get_well_composition("C01") == {"A.A01": 1}
+        return
+
 
 class TestTroughLabwareWorklist:
     def test_aspirate(self) -> None:
@@ -23,6 +23,15 @@ _WELLID_MATCHER = re.compile(r"^([a-zA-Z]+?)(\d+?)$")
 
 def get_well_position(labware: Labware, well: str) -> int:
     """Calculate the EVO-style well position from the alphanumeric ID."""
+    # The positions of the labware's own well IDs are precomputed from all of its (virtual) rows.
+    # Plates with more rows than row IDs fall back to the formula below, which counts only
+    # the row IDs, so that they keep their original numbering.
+    has_rows_without_ids = labware.virtual_rows is None and len(labware._volumes) > labware.n_rows
+    if not has_rows_without_ids:
+        position = labware._positions.get(well)
+        if position is not None:
+            return position
+
     # Extract row & column number from the alphanumeric ID
     m = _WELLID_MATCHER.match(well)
     if m is None:
@@ -12,11 +12,6 @@ from robotools.evotools import commands
 from robotools.evotools.types import Tip
 from robotools.evotools.utils import get_well_position
 from robotools.worklists.base import BaseWorklist
-from robotools.worklists.utils import (
-    optimize_partition_by,
-    partition_by_column,
-    partition_volume,
-)
 
 __all__ = ("EvoWorklist", "Worklist")
 
@@ -26,6 +21,8 @@ logger = logging.getLogger(__name__)
 class EvoWorklist(BaseWorklist):
     """Context manager for the creation of Tecan EVO worklists."""
 
+    __slots__ = ()
+
     def _get_well_position(self, labware: liquidhandling.Labware, well: str) -> int:
         return get_well_position(labware, well)
 
@@ -257,10 +254,10 @@ class EvoWorklist(BaseWorklist):
             Take a look at `Worklist.aspirate_well` for the full list of options.
         """
         # reformat the convenience parameters
-        source_wells = np.array(source_wells).flatten("F")
-        destination_wells = np.array(destination_wells).flatten("F")
-        volumes = np.array(volumes).flatten("F")
-        nmax = max((len(source_wells), len(destination_wells), len(volumes)))
+        source_wells = np.asarray(source_wells).ravel("F")
+        destination_wells = np.asarray(destination_wells).ravel("F")
+        volumes = np.asarray(volumes).ravel("F")
+        nmax = max(len(source_wells), len(destination_wells), len(volumes))
 
         # Deal with deprecated behavior
         if wash_scheme is None:
@@ -271,84 +268,35 @@ class EvoWorklist(BaseWorklist):
             )
             wash_scheme = "reuse"
 
-        if len(source_wells) == 1:
-            source_wells = np.repeat(source_wells, nmax)
-        if len(destination_wells) == 1:
-            destination_wells = np.repeat(destination_wells, nmax)
-        if len(volumes) == 1:
-            volumes = np.repeat(volumes, nmax)
+        if nmax > 1:
+            if len(source_wells) == 1:
+                source_wells = np.repeat(source_wells, nmax)
+            if len(destination_wells) == 1:
+                destination_wells = np.repeat(destination_wells, nmax)
+            if len(volumes) == 1:
+                volumes = np.repeat(volumes, nmax)
         lengths = (len(source_wells), len(destination_wells), len(volumes))
         assert (
-            len(set(lengths)) == 1
+            lengths[0] == lengths[1] == lengths[2]
         ), f"Number of source/destination/volumes must be equal. They were {lengths}"
 
-        # automatic partitioning
-        partition_by = optimize_partition_by(source, destination, partition_by, label)
-
-        # the label applies to the entire transfer operation and is not logged at individual aspirate/dispense steps
-        self.comment(label)
-        nsteps = 0
-        lvh_extra = 0
-
-        for srcs, dsts, vols in partition_by_column(source_wells, destination_wells, volumes, partition_by):
-            # make vector of volumes into vector of volume-lists
-            vol_lists = [
-                partition_volume(float(v), max_volume=self.max_volume) if self.auto_split else [v]
-                for v in vols
-            ]
-            # transfer from this source column until all wells are done
-            npartitions = max(map(len, vol_lists))
-            # Count only the extra steps created by LVH
-            lvh_extra += sum([len(vs) - 1 for vs in vol_lists])
-            for p in range(npartitions):
-                naccessed = 0
-                # iterate the rows
-                for s, d, vs in zip(srcs, dsts, vol_lists):
-                    # transfer the next volume-fraction for this well
-                    if len(vs) > p:
-                        v = vs[p]
-                        if v > 0:
-                            self.aspirate(source, s, v, label=None, **kwargs)
-                            self.dispense(
-                                destination,
-                                d,
-                                v,
-                                label=None,
-                                compositions=[source.get_well_composition(s)],
-                                **kwargs,
-                            )
-                            nsteps += 1
-                            if wash_scheme == "flush":
-                                self.flush()
-                            elif wash_scheme == "reuse":
-                                pass
-                            else:
-                                self.wash(scheme=wash_scheme)
-                            naccessed += 1
-                # LVH: if multiple wells are accessed, don't group across partitions
-                if npartitions > 1 and naccessed > 1 and not p == npartitions - 1:
-                    self.commit()
-            # LVH: don't group across columns
-            if npartitions > 1:
-                self.commit()
-
-        # Condense the labware logs into one operation
-        # after the transfer operation completed to facilitate debugging.
-        # Also include the number of extra steps because of LVH if applicable.
-        if lvh_extra:
-            if label:
-                label = f"{label} ({lvh_extra} LVH steps)"
-            else:
-                label = f"{lvh_extra} LVH steps"
-        if destination == source:
-            source.condense_log(nsteps * 2, label=label)
-        else:
-            source.condense_log(nsteps, label=label)
-            destination.condense_log(nsteps, label=label)
+        self._transfer_partitioned(
+            source,
+            source_wells,
+            destination,
+            destination_wells,
+            volumes,
+            label=label,
+            wash_scheme=wash_scheme,
+            partition_by=partition_by,
+            **kwargs,
+        )
         return
 
 
 class Worklist(EvoWorklist):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         msg = textwrap.dedent(
             """
@@ -9,6 +9,15 @@ _WELLID_MATCHER = re.compile(r"^([a-zA-Z]+?)(\d+?)$")
 
 def get_well_position(labware: Labware, well: str) -> int:
     """Calculate the EVO-style well position from the alphanumeric ID."""
+    # The numpy indices of the labware's own well IDs are precomputed
+    idx = labware.indices.get(well)
+    if idx is not None:
+        r, c = idx
+        # The Fluent does NOT count rows inside troughs!
+        if labware.is_trough:
+            return 1 + c
+        return 1 + c * labware.n_rows + r
+
     # Extract row & column number from the alphanumeric ID
     m = _WELLID_MATCHER.match(well)
     if m is None:
@@ -32,14 +32,14 @@ def combine_composition(
     if composition_A is None or composition_B is None:
         return None
     # convert to volumetric fractions
-    volumetric_fractions = {k: f * volume_A for k, f in composition_A.items()}
+    new_composition = {k: f * volume_A for k, f in composition_A.items()}
     # volumetrically add incoming fractions
     for k, f in composition_B.items():
-        if not k in volumetric_fractions:
-            volumetric_fractions[k] = 0
-        volumetric_fractions[k] += f * volume_B
-    # convert back to relative fractions
-    new_composition = {k: v / (volume_A + volume_B) for k, v in volumetric_fractions.items()}
+        new_composition[k] = new_composition.get(k, 0) + f * volume_B
+    # convert back to relative fractions in place
+    volume = volume_A + volume_B
+    for k, v in new_composition.items():
+        new_composition[k] = v / volume
     return new_composition
 
 
@@ -67,35 +67,38 @@ def get_initial_composition(
     composition : dict
         The component-wise dictionary of numpy arrays that describe the composition of real wells.
     """
-    possible_component_wells = set(np.unique(real_wells))
-    illegal_component_wells = set(component_names.keys()) - possible_component_wells
-    if illegal_component_wells:
-        raise ValueError(f"Invalid component name keys: {illegal_component_wells}")
-
-    is_multiwell = len(real_wells) > 1
-    composition: Dict[str, np.ndarray] = {}
-    for idx, w in np.ndenumerate(real_wells):
-        # Ignore None-valued component names, but don't allow naming of empty wells.
-        if initial_volumes[idx] == 0:
+    real_wells = np.asarray(real_wells)
+    if component_names:
+        illegal_component_wells = set(component_names.keys()) - set(real_wells.flat)
+        if illegal_component_wells:
+            raise ValueError(f"Invalid component name keys: {illegal_component_wells}")
+
+    # only the initial volumes of real wells are relevant
+    filled = np.asarray(initial_volumes)[: real_wells.shape[0], : real_wells.shape[1]] != 0
+    # Ignore None-valued component names, but don't allow naming of empty wells.
+    if component_names:
+        for w in real_wells[~filled]:
             if component_names.get(w, None) is not None:
                 raise ValueError(
                     f"A component name '{component_names[w]}' was specified for {name}.{w}, but the corresponding initial volume is 0."
                 )
-            continue
 
-        # Fetch a name for identifying the liquid from this non-empty well
+    # Fetch names for identifying the liquids from the non-empty wells
+    is_multiwell = len(real_wells) > 1
+    cnames = []
+    for w in real_wells[filled]:
         cname = component_names.get(w, None)
         if cname is None:
-            default_name = f"{name}.{w}" if is_multiwell else name
-            cname = default_name
-
-        # Make sure that a composition array exists
-        if cname not in composition:
-            composition[cname] = np.zeros_like(real_wells, dtype=float)
-
-        # Mark this well as filled by this component
-        composition[cname][idx] = 1
-    return composition
+            cname = f"{name}.{w}" if is_multiwell else name
+        cnames.append(cname)
+
+    # Number the components by first occurrence and mark their wells in one assignment
+    component_ids: Dict[str, int] = {}
+    ids = [component_ids.setdefault(cname, len(component_ids)) for cname in cnames]
+    fractions = np.zeros((len(component_ids), *real_wells.shape))
+    rows, columns = np.nonzero(filled)
+    fractions[ids, rows, columns] = 1
+    return dict(zip(component_ids, fractions))
 
 
 def get_trough_component_names(
@@ -1,13 +1,24 @@
 """Object-oriented, stateful labware representations."""
 
 
+import contextlib
+import sys
 import warnings
-from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 
 from robotools.liquidhandling.composition import (
-    combine_composition,
     get_initial_composition,
     get_trough_component_names,
 )
@@ -20,25 +31,67 @@ from robotools.liquidhandling.exceptions import (
 class Labware:
     """Represents an array of liquid cavities."""
 
+    __slots__ = (
+        "name",
+        "row_ids",
+        "column_ids",
+        "min_volume",
+        "max_volume",
+        "virtual_rows",
+        "_wells",
+        "_indices",
+        "_positions",
+        "_well_ids",
+        "_idx_table",
+        "_sorted_wells",
+        "_sorted_idx",
+        "_volumes",
+        "_history",
+        "_history_length",
+        "_history_shared",
+        "_history_views",
+        "_labels",
+        "_deferred_log",
+        "_components",
+        "_component_indices",
+        "_fractions",
+    )
+
     @property
     def history(self) -> List[Tuple[Optional[str], np.ndarray]]:
-        """List of label/volumes history."""
-        return list(zip(self._labels, self._history))
+        """List of label/volumes history.
+
+        The volumes are read-only views of the history buffer, which are not affected by later operations.
+        """
+        views = self._history_views
+        if len(views) < self._history_length:
+            # the views of new states are created only once
+            states = self._history[len(views) : self._history_length].view()
+            states.flags.writeable = False
+            views.extend(states)
+        # condensing must not overwrite the states of these views
+        self._history_shared = True
+        return list(zip(self._labels, views))
 
     @property
     def report(self) -> str:
         """A printable report of the labware history."""
         report = self.name
-        for label, state in self.history:
+        # round all states at once
+        states = np.round(self._history[: self._history_length], decimals=1)
+        for label, state in zip(self._labels, states):
             if label:
                 report += f"\n{label}"
-            report += f"\n{np.round(state, decimals=1)}"
+            report += f"\n{state}"
             report += "\n"
         return report
 
     @property
     def volumes(self) -> np.ndarray:
-        """Current volumes in the labware."""
+        """Current volumes in the labware.
+
+        This is a copy that is not affected by later operations.
+        """
         return self._volumes.copy()
 
     @property
@@ -77,15 +130,18 @@ class Labware:
 
     @property
     def is_trough(self) -> bool:
-        return self.virtual_rows != None
+        return self.virtual_rows is not None
 
     @property
     def composition(self) -> Dict[str, np.ndarray]:
         """Relative composition of the liquids.
 
         This dictionary maps liquid names (keys) to arrays of relative amounts in each well.
+        It is created on every access, so items that are assigned to it are not kept in the labware.
+        Use `add` with `compositions` to track new liquids instead.
+        The arrays are views of the labware state, which are replaced when new liquids are added.
         """
-        return self._composition
+        return {k: self._fractions[i] for i, k in enumerate(self._components)}
 
     def __init__(
         self,
@@ -155,9 +211,9 @@ class Labware:
             rows,
             columns,
         ), f"Invalid shape of initial_volumes: {initial_volumes.shape}"
-        if np.any(initial_volumes < 0):
+        if initial_volumes.min() < 0:
             raise ValueError("initial_volume cannot be negative")
-        if np.any(initial_volumes > max_volume):
+        if initial_volumes.max() > max_volume:
             raise ValueError("initial_volume cannot be above max_volume")
 
         # initialize properties
@@ -169,42 +225,106 @@ class Labware:
         self.virtual_rows = virtual_rows
 
         # generate arrays/mappings of well ids
-        self._wells = np.array([[f"{row}{column:02d}" for column in self.column_ids] for row in self.row_ids])
-        if virtual_rows is None:
-            self._indices = {
-                f"{row}{column:02d}": (r, c)
-                for r, row in enumerate(self.row_ids)
-                for c, column in enumerate(self.column_ids)
-            }
-            self._positions = {
-                f"{row}{column:02d}": 1 + c * rows + r
-                for r, row in enumerate(self.row_ids)
-                for c, column in enumerate(self.column_ids)
-            }
-        else:
-            self._indices = {
-                f"{vrow}{column:02d}": (0, c)
-                for vr, vrow in enumerate(self.row_ids)
-                for c, column in enumerate(self.column_ids)
-            }
-            self._positions = {
-                f"{vrow}{column:02d}": 1 + c * virtual_rows + vr
-                for vr, vrow in enumerate(self.row_ids)
-                for c, column in enumerate(self.column_ids)
-            }
+        column_labels = np.array([f"{column:02d}" for column in self.column_ids])
+        self._wells = np.char.add(np.array(self.row_ids)[:, None], column_labels[None, :])
+        # interned keys let lookups with literal well ids (which Python interns) match by identity
+        well_ids = list(map(sys.intern, self._wells.ravel().tolist()))
+        r, c = np.indices(self._wells.shape).reshape(2, -1)
+        # virtual rows of troughs share the same real well
+        real_r = r if virtual_rows is None else np.zeros_like(r)
+        self._indices = dict(zip(well_ids, zip(real_r.tolist(), c.tolist())))
+        # positions count the (virtual) rows, even beyond the lettered ones
+        n_position_rows = virtual_rows if virtual_rows is not None else rows
+        self._positions = dict(zip(well_ids, (1 + c * n_position_rows + r).tolist()))
+
+        # integer ids of the wells index into a table of (row, column) indices
+        self._well_ids = {well: i for i, well in enumerate(self._indices)}
+        self._idx_table = np.array(list(self._indices.values()), dtype=np.intp)
+        # sorted well ids for binary searches of many wells at once
+        order = np.argsort(self._wells, axis=None)
+        self._sorted_wells = self._wells.ravel()[order]
+        self._sorted_idx = self._idx_table[order]
 
         # initialize state variables
-        self._volumes = initial_volumes.copy().astype(float)
-        self._history: List[np.ndarray] = [self.volumes]
+        # astype always returns a new array
+        self._volumes = initial_volumes.astype(float)
+        # snapshots of the volumes are kept in a buffer that grows by doubling
+        self._history = np.empty((16, *self._volumes.shape))
+        self._history[0] = self._volumes
+        self._history_length = 1
+        self._history_shared = False
+        self._history_views: List[np.ndarray] = []
         self._labels: List[Optional[str]] = ["initial"]
-        self._composition = get_initial_composition(
+        self._deferred_log = False
+        # the fractions of all components are stored in one (capacity, rows, columns) array
+        initial_composition = get_initial_composition(
             name,
             real_wells=self.wells[[0], :] if virtual_rows else self.wells,
             component_names=component_names or {},
             initial_volumes=initial_volumes,
         )
+        self._components: List[str] = []
+        self._component_indices: Dict[str, int] = {}
+        self._fractions = np.zeros((0, *self._volumes.shape))
+        self._add_components(initial_composition)
+        for i, fractions in enumerate(initial_composition.values()):
+            # labware with more rows than row ids only has compositions of the lettered rows
+            self._fractions[i, : fractions.shape[0], : fractions.shape[1]] = fractions
         super().__init__()
 
+    def _add_components(self, names: Iterable[str]) -> None:
+        """Starts tracking the fractions of liquids that are not tracked yet."""
+        for k in names:
+            if not k in self._component_indices:
+                self._component_indices[k] = len(self._components)
+                self._components.append(k)
+        n = len(self._components)
+        if n > len(self._fractions):
+            # grow by doubling, the new fractions are zero
+            fractions = np.zeros((max(n, 2 * len(self._fractions)), *self._volumes.shape))
+            fractions[: len(self._fractions)] = self._fractions
+            self._fractions = fractions
+        return
+
+    def _get_indices(self, wells: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Translates a vector of well ids into row and column index vectors."""
+        # for large batches, decoding the ids is cheaper than looking each of them up
+        if len(wells) >= 256 and wells.dtype == np.dtype("U3"):
+            decoded = self._decode_indices(wells)
+            if decoded is not None:
+                return decoded
+        if len(wells) >= 32 and wells.dtype.kind == "U":
+            # for medium batches, one binary search is cheaper than the lookups
+            pos = np.searchsorted(self._sorted_wells, wells)
+            pos[pos == len(self._sorted_wells)] = 0
+            # unknown wells are left to the lookup below, which raises the KeyError
+            if np.all(self._sorted_wells[pos] == wells):
+                idx = self._sorted_idx[pos]
+                return idx[:, 0], idx[:, 1]
+        ids = np.fromiter(map(self._well_ids.__getitem__, wells), dtype=np.intp, count=len(wells))
+        idx = self._idx_table[ids]
+        return idx[:, 0], idx[:, 1]
+
+    def _decode_indices(self, wells: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Decodes well ids of the form "<row letter><2-digit column>" into row and column index vectors.
+
+        Returns None if any of the ids is not a well of this labware.
+        """
+        codes = np.ascontiguousarray(wells).view(np.uint32).reshape(-1, 3).astype(np.intp)
+        r = codes[:, 0] - ord("A")
+        tens = codes[:, 1] - ord("0")
+        ones = codes[:, 2] - ord("0")
+        c = tens * 10 + ones - 1
+        valid = (0 <= r) & (r < self.n_rows) & (0 <= c) & (c < self.n_columns)
+        # both column characters must be digits
+        valid &= (0 <= tens) & (tens < 10) & (0 <= ones) & (ones < 10)
+        if not np.all(valid):
+            return None
+        if self.virtual_rows is not None:
+            # virtual rows of troughs share the same real well
+            r = np.zeros_like(r)
+        return r, c
+
     def get_well_composition(self, well: str) -> Dict[str, float]:
         """Retrieves the relative composition of a well.
 
@@ -219,18 +339,42 @@ class Labware:
             Keys: liquid names
             Values: relative amount
         """
-        if self._composition is None:
-            return None
-        idx = self.indices[well]
-        well_comp = {k: f[idx] for k, f in self.composition.items() if f[idx] > 0}
+        r, c = self._indices[well]
+        fractions = self._fractions[: len(self._components), r, c]
+        well_comp = {self._components[i]: fractions[i] for i in np.flatnonzero(fractions > 0)}
         return well_comp
 
+    def get_well_compositions(self, wells: Union[Sequence[str], np.ndarray]) -> Dict[str, np.ndarray]:
+        """Retrieves the relative compositions of many wells at once.
+
+        Parameters
+        ----------
+        wells : array-like
+            IDs of the wells for which to retrieve the compositions.
+
+        Returns
+        -------
+        compositions : dict
+            Keys: liquid names that are present in any of the wells, in the order of their first well
+            Values: arrays of relative amounts in the wells
+        """
+        r, c = self._get_indices(np.asarray(wells).ravel("F"))
+        fractions = self._fractions[: len(self._components), r, c]
+        # like in `get_well_composition`, only positive fractions are present
+        present = fractions > 0
+        first = np.where(np.any(present, axis=1), np.argmax(present, axis=1), len(r))
+        order = np.lexsort((np.arange(len(first)), first))
+        fractions = np.where(present, fractions, 0)
+        return {self._components[i]: fractions[i] for i in order[: np.count_nonzero(first < len(r))]}
+
     def add(
         self,
         wells: Union[str, Sequence[str], np.ndarray],
         volumes: Union[float, Sequence[float], np.ndarray],
         label: Optional[str] = None,
-        compositions: Optional[Sequence[Optional[Mapping[str, float]]]] = None,
+        compositions: Optional[
+            Union[Sequence[Optional[Mapping[str, float]]], Mapping[str, np.ndarray]]
+        ] = None,
     ) -> None:
         """Adds volumes to wells.
 
@@ -242,48 +386,181 @@ class Labware:
             Scalar or iterable of volumes
         label : str
             Description of the operation
-        compositions : iterable
-            List of composition dictionaries ({ name : relative amount })
+        compositions : iterable, dict
+            List of composition dictionaries ({ name : relative amount }),
+            or a dictionary of relative amounts in all wells ({ name : amounts }) like `get_well_compositions`.
         """
-        wells = np.array(wells).flatten("F")
-        volumes = np.array(volumes).flatten("F")
+        if isinstance(wells, str) and isinstance(volumes, (int, float)) and compositions is None:
+            # single wells are common enough to skip the array handling
+            assert volumes >= 0, "Volumes must be positive or zero."
+            r, c = self._indices[wells]
+            v_well = self._volumes[r, c]
+            if v_well + volumes > self.max_volume:
+                raise VolumeOverflowError(self.name, wells, v_well, volumes, self.max_volume, label)
+            self._volumes[r, c] = v_well + volumes
+            self.log(label)
+            return
+
+        # views of already flat inputs, instead of copies
+        wells = np.asarray(wells).ravel("F")
+        volumes = np.asarray(volumes).ravel("F")
         if len(volumes) == 1:
-            volumes = np.repeat(volumes, len(wells))
+            # broadcasting makes a read-only view instead of repeating the scalar for every well
+            volumes = np.broadcast_to(volumes, wells.shape)
         assert len(volumes) == len(wells), "Number of volumes must equal the number of wells"
-        assert np.all(volumes >= 0), "Volumes must be positive or zero."
-        if compositions is not None:
+        assert volumes.min(initial=0) >= 0, "Volumes must be positive or zero."
+        if isinstance(compositions, Mapping):
+            assert all(
+                np.shape(f) == wells.shape for f in compositions.values()
+            ), "Relative amounts must be given for all of the wells."
+        elif compositions is not None:
             assert len(compositions) == len(
                 wells
             ), "Well compositions must be given for either all or none of the wells."
-        else:
-            compositions = [None] * len(wells)
-
-        for well, volume, composition in zip(wells, volumes, compositions):
-            idx = self.indices[well]
-            v_original = self._volumes[idx]
-            v_new = v_original + volume
-
-            if v_new > self.max_volume:
-                raise VolumeOverflowError(self.name, well, v_original, volume, self.max_volume, label)
-
-            self._volumes[idx] = v_new
-
-            if composition is not None and self._composition is not None:
-                assert isinstance(composition, dict), "Well compositions must be given as dicts"
-                # update the volumentric composition for this well
-                original_composition = self.get_well_composition(well)
-                new_composition = combine_composition(v_original, original_composition, volume, composition)
-                if new_composition is None:
-                    continue
-                for k, f in new_composition.items():
-                    if not k in self._composition:
-                        # a new liquid is being added
-                        self._composition[k] = np.zeros_like(self.volumes)
-                    self._composition[k][idx] = f
-
+            if all(c is None for c in compositions):
+                compositions = None
+        idx = self._get_indices(wells)
+
+        v_new = self._volumes.copy()
+        # unbuffered, so that repeated wells are filled one after another
+        np.add.at(v_new, idx, volumes)
+        if np.any(v_new[idx] > self.max_volume):
+            # replay the filling to report the first well that overflowed
+            v_running = self._volumes.copy()
+            for well, r, c, volume in zip(wells, *idx, volumes):
+                v_well = v_running[r, c]
+                if v_well + volume > self.max_volume:
+                    raise VolumeOverflowError(self.name, well, v_well, volume, self.max_volume, label)
+                v_running[r, c] = v_well + volume
+        if compositions is not None:
+            f_in, given, has_composition = self._get_incoming_fractions(compositions, len(wells))
+            self._mix_repeatedly(idx, volumes, f_in, given, has_composition)
+        self._volumes[:] = v_new
         self.log(label)
         return
 
+    def _get_incoming_fractions(
+        self,
+        compositions: Union[Sequence[Optional[Mapping[str, float]]], Mapping[str, np.ndarray]],
+        n: int,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Translates the compositions of n added liquids into arrays of the tracked components.
+
+        Returns
+        -------
+        f_in : numpy.ndarray
+            (n_components, n) fractions of the added liquids
+        given : numpy.ndarray
+            (n_components, n) mask of the fractions that are part of the compositions
+        has_composition : numpy.ndarray
+            (n,) mask of the added liquids that have a composition
+        """
+        # new liquids may be added
+        if isinstance(compositions, Mapping):
+            self._add_components(compositions)
+            rows = [self._component_indices[k] for k in compositions]
+            fractions = np.array(list(compositions.values()), dtype=float).reshape(len(compositions), n)
+            present = fractions > 0
+            f_in = np.zeros((len(self._components), n))
+            f_in[rows] = np.where(present, fractions, 0)
+            given = np.zeros(f_in.shape, dtype=bool)
+            given[rows] = present
+            return f_in, given, np.ones(n, dtype=bool)
+
+        # the same composition object is typically given for many wells (e.g. from one stock)
+        groups: Dict[int, Tuple[Mapping[str, float], List[int]]] = {}
+        for i, composition in enumerate(compositions):
+            if composition is not None:
+                groups.setdefault(id(composition), (composition, []))[1].append(i)
+        for composition, _ in groups.values():
+            assert isinstance(composition, dict), "Well compositions must be given as dicts"
+            self._add_components(composition)
+
+        f_in = np.zeros((len(self._components), n))
+        given = np.zeros(f_in.shape, dtype=bool)
+        for composition, members in groups.values():
+            for k, f in composition.items():
+                f_in[self._component_indices[k], members] = f
+                given[self._component_indices[k], members] = True
+        return f_in, given, np.array([c is not None for c in compositions])
+
+    def _mix_repeatedly(
+        self,
+        idx: Tuple[np.ndarray, np.ndarray],
+        volumes: np.ndarray,
+        f_in: np.ndarray,
+        given: np.ndarray,
+        has_composition: np.ndarray,
+    ) -> None:
+        """Updates the compositions of wells that may be repeated, in order.
+
+        The n-th addition to each well is mixed in the n-th round,
+        so that every round mixes into distinct wells.
+        """
+        flat = np.ravel_multi_index(idx, self._volumes.shape)
+        order = np.argsort(flat, kind="stable")
+        # position of every addition among the additions to the same well
+        positions = np.arange(len(flat))
+        is_first = np.ones(len(flat), dtype=bool)
+        is_first[1:] = flat[order][1:] != flat[order][:-1]
+        rounds = np.empty_like(positions)
+        rounds[order] = positions - np.maximum.accumulate(np.where(is_first, positions, 0))
+
+        v_running = self._volumes.copy()
+        for n in range(rounds.max(initial=-1) + 1):
+            members = np.flatnonzero(rounds == n)
+            idx_n = (idx[0][members], idx[1][members])
+            v_original = v_running[idx_n]
+            self._mix_compositions(
+                idx_n,
+                v_original,
+                volumes[members],
+                f_in[:, members],
+                given[:, members],
+                has_composition[members],
+            )
+            v_running[idx_n] = v_original + volumes[members]
+        return
+
+    def _mix_compositions(
+        self,
+        idx: Tuple[np.ndarray, np.ndarray],
+        v_original: np.ndarray,
+        volumes: np.ndarray,
+        f_in: np.ndarray,
+        given: np.ndarray,
+        has_composition: np.ndarray,
+    ) -> None:
+        """Updates the compositions of distinct wells like `combine_composition`, but for all of them at once.
+
+        Parameters
+        ----------
+        idx : tuple of arrays
+            Row and column indices of the wells
+        v_original : numpy.ndarray
+            Volumes of the wells before the addition
+        volumes : numpy.ndarray
+            Added volumes
+        f_in : numpy.ndarray
+            (n_components, n_wells) fractions of the added liquids
+        given : numpy.ndarray
+            (n_components, n_wells) mask of the fractions that are part of the added compositions
+        has_composition : numpy.ndarray
+            Mask of the wells that are mixed.
+        """
+        r, c = idx
+        fractions = self._fractions[: len(f_in), r, c]
+        # like in `get_well_composition`, only positive fractions are present
+        present = fractions > 0
+        current = np.where(present, fractions, 0)
+        # components that are neither present nor added remain untouched
+        ic, iw = np.nonzero(has_composition & (present | given))
+        v_total = v_original + volumes
+        self._fractions[ic, r[iw], c[iw]] = (
+            current[ic, iw] * v_original[iw] + f_in[ic, iw] * volumes[iw]
+        ) / v_total[iw]
+        return
+
     def remove(
         self,
         wells: Union[str, Sequence[str], np.ndarray],
@@ -301,21 +578,38 @@ class Labware:
         label : str
             Description of the operation
         """
-        wells = np.array(wells).flatten("F")
-        volumes = np.array(volumes).flatten("F")
+        if isinstance(wells, str) and isinstance(volumes, (int, float)):
+            # single wells are common enough to skip the array handling
+            assert volumes >= 0, "Volumes must be positive or zero."
+            r, c = self._indices[wells]
+            v_well = self._volumes[r, c]
+            if v_well - volumes < self.min_volume:
+                raise VolumeUnderflowError(self.name, wells, v_well, volumes, self.min_volume, label)
+            self._volumes[r, c] = v_well - volumes
+            self.log(label)
+            return
+
+        # views of already flat inputs, instead of copies
+        wells = np.asarray(wells).ravel("F")
+        volumes = np.asarray(volumes).ravel("F")
         if len(volumes) == 1:
-            volumes = np.repeat(volumes, len(wells))
+            # broadcasting makes a read-only view instead of repeating the scalar for every well
+            volumes = np.broadcast_to(volumes, wells.shape)
         assert len(volumes) == len(wells), "Number of volumes must number of wells"
-        assert np.all(volumes >= 0), "Volumes must be positive or zero."
-        for well, volume in zip(wells, volumes):
-            idx = self.indices[well]
-            v_original = self._volumes[idx]
-            v_new = v_original - volume
-
-            if v_new < self.min_volume:
-                raise VolumeUnderflowError(self.name, well, v_original, volume, self.min_volume, label)
-
-            self._volumes[idx] -= volume
+        assert volumes.min(initial=0) >= 0, "Volumes must be positive or zero."
+        idx = self._get_indices(wells)
+        v_new = self._volumes.copy()
+        # unbuffered, so that repeated wells are emptied one after another
+        np.subtract.at(v_new, idx, volumes)
+        if np.any(v_new[idx] < self.min_volume):
+            # replay the removal to report the first well that underflowed
+            v_running = self._volumes.copy()
+            for well, r, c, volume in zip(wells, *idx, volumes):
+                v_well = v_running[r, c]
+                if v_well - volume < self.min_volume:
+                    raise VolumeUnderflowError(self.name, well, v_well, volume, self.min_volume, label)
+                v_running[r, c] = v_well - volume
+        self._volumes[:] = v_new
         self.log(label)
         return
 
@@ -327,7 +621,14 @@ class Labware:
         label : str
             A label to insert in the history.
         """
-        self._history.append(self.volumes)
+        if self._deferred_log:
+            return
+        if self._history_length == len(self._history):
+            self._history = np.concatenate([self._history, np.empty_like(self._history)])
+            self._history_shared = False
+            self._history_views = []
+        self._history[self._history_length] = self._volumes
+        self._history_length += 1
         self._labels.append(label)
         return
 
@@ -341,21 +642,54 @@ class Labware:
         label : str
             'first', 'last' or label of the condensed entry (default: label of the last entry in the condensate)
         """
+        if self._deferred_log:
+            # the entries were not logged in the first place
+            return
         if label == "first":
             label = self._labels[len(self._labels) - n]
         if label == "last":
             label = self._labels[-1]
-        state = self._history[-1]
+        state = self._history[self._history_length - 1]
+        if self._history_shared:
+            # the buffer is copied on write, because `history` handed out views of it
+            self._history = self._history.copy()
+            self._history_shared = False
         # cut away the history
         self._labels = self._labels[:-n]
-        self._history = self._history[:-n]
+        self._history_length = len(self._labels)
+        del self._history_views[self._history_length :]
         # append the last state
         self._labels.append(label)
-        self._history.append(state)
+        self._history[self._history_length] = state
+        self._history_length += 1
+        return
+
+    @contextlib.contextmanager
+    def transaction(self, label: Optional[str] = None) -> Iterator["Labware"]:
+        """Context manager that logs all operations within the context as one history entry.
+
+        Logging is deferred until the context exits, so that individual
+        operations don't pay for a snapshot of the volumes.
+        Nested transactions become part of the outermost one.
+
+        Parameters
+        ----------
+        label : str
+            Label of the history entry
+        """
+        if self._deferred_log:
+            yield self
+            return
+        self._deferred_log = True
+        try:
+            yield self
+        finally:
+            self._deferred_log = False
+            self.log(label)
         return
 
     def __repr__(self) -> str:
-        return f"{self.name}\n{np.round(self.volumes, decimals=1)}"
+        return f"{self.name}\n{np.round(self._volumes, decimals=1)}"
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -364,6 +698,8 @@ class Labware:
 class Trough(Labware):
     """Special type of labware that can be accessed by many pipette tips in parallel."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
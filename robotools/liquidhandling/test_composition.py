@@ -60,6 +60,13 @@ class TestCompositionTracking:
         assert "samples.A01" in result
         assert "water" in result
         assert "samples.B03" in result
+
+        # Only the initial volumes of real wells are relevant (e.g. labware with more rows than row ids)
+        volumes = np.array([[1, 0], [0, 2], [3, 3]])
+        result = get_initial_composition("big", [["A01", "A02"], ["B01", "B02"]], {}, volumes)
+        assert list(result) == ["big.A01", "big.B02"]
+        np.testing.assert_array_equal(result["big.A01"], [[1, 0], [0, 0]])
+        np.testing.assert_array_equal(result["big.B02"], [[0, 0], [0, 1]])
         return
 
     def test_get_trough_component_names(self) -> None:
@@ -135,14 +142,16 @@ class TestCompositionTracking:
         # Only wells with initial volumes take part
         A = Labware("test", 1, 3, **minmax, initial_volumes=[10, 0, 0], component_names=dict(A01="water"))
         assert set(A.composition) == {"water"}
+
+        # Labware with more rows than row ids tracks the wells that have ids
+        A = Labware("big", 30, 2, **minmax, initial_volumes=1, component_names=dict(Z02="water"))
+        assert len(A.composition) == 52
+        assert A.get_well_composition("Z02") == {"water": 1}
         return
 
     def test_get_well_composition(self) -> None:
         A = Labware("glc", 6, 8, min_volume=0, max_volume=4000)
-        A._composition = {
-            "glc": 0.25 * np.ones_like(A.volumes),
-            "water": 0.75 * np.ones_like(A.volumes),
-        }
+        A.add(A.wells, 100, compositions=[dict(glc=0.25, water=0.75)] * 48)
         expected = {
             "glc": 0.25,
             "water": 0.75,
@@ -150,6 +159,26 @@ class TestCompositionTracking:
         assert A.get_well_composition("A01") == expected
         return
 
+    def test_get_well_compositions(self) -> None:
+        A = Labware("A", 2, 3, min_volume=0, max_volume=4000, initial_volumes=[[100, 0, 0], [0, 50, 0]])
+        A.add("A02", 50, compositions=[dict(glc=0.5, water=0.5)])
+        compositions = A.get_well_compositions(["B02", "A03", "A02", "B02"])
+        # only liquids of the wells, in the order of their first well
+        assert list(compositions) == ["A.B02", "glc", "water"]
+        np.testing.assert_array_equal(compositions["A.B02"], [1, 0, 0, 1])
+        np.testing.assert_array_equal(compositions["glc"], [0, 0, 0.5, 0])
+        # the same as the compositions of the individual wells
+        B = Labware("B", 2, 3, min_volume=0, max_volume=4000)
+        C = Labware("C", 2, 3, min_volume=0, max_volume=4000)
+        sources = ["A02", "B02", "A01", "A03"]
+        wells = ["A01", "A02", "A02", "B03"]
+        B.add(wells, [10, 20, 30, 40], compositions=A.get_well_compositions(sources))
+        C.add(wells, [10, 20, 30, 40], compositions=[A.get_well_composition(s) for s in sources])
+        assert list(B.composition) == list(C.composition) == ["glc", "water", "A.B02", "A.A01"]
+        for k in B.composition:
+            np.testing.assert_array_equal(B.composition[k], C.composition[k])
+        return
+
     def test_labware_add(self) -> None:
         A = Labware(
             "water",
@@ -190,6 +219,28 @@ class TestCompositionTracking:
         assert A.get_well_composition("B01") == dict(water=1 / 3, glc=2 / 3)
         return
 
+    def test_labware_add_many(self) -> None:
+        wells = ["A01", "A02", "B02", "A02", "B01"]
+        volumes = [10, 20, 5, 20, 30]
+        compositions = [dict(glc=0.5, water=0.5), dict(glc=1), None, dict(salt=1), dict(water=1)]
+        # adding at once or one well at a time must give the same compositions
+        A = Labware("A", 2, 2, min_volume=0, max_volume=100, initial_volumes=[[0, 10], [20, 40]])
+        A.add(wells=wells, volumes=volumes, compositions=compositions)
+        B = Labware("A", 2, 2, min_volume=0, max_volume=100, initial_volumes=[[0, 10], [20, 40]])
+        for w, v, c in zip(wells, volumes, compositions):
+            B.add(wells=w, volumes=v, compositions=[c])
+        np.testing.assert_array_equal(A.volumes, B.volumes)
+        assert list(A.composition) == list(B.composition)
+        for k, fractions in A.composition.items():
+            np.testing.assert_array_equal(fractions, B.composition[k])
+        assert A.get_well_composition("A02") == {"A.A02": 0.2, "glc": 0.4, "salt": 0.4}
+
+        # without repeated wells, all wells are mixed at once
+        A.add(wells=["A01", "B01"], volumes=[10, 50], compositions=[dict(salt=1), dict(glc=1)])
+        assert A.get_well_composition("A01") == dict(glc=0.25, water=0.25, salt=0.5)
+        assert A.get_well_composition("B01") == {"A.B01": 0.2, "water": 0.3, "glc": 0.5}
+        return
+
     def test_dilution_series(self) -> None:
         A = Labware("dilutions", 1, 3, min_volume=0, max_volume=100)
         # 100 % in 1st column
@@ -315,9 +366,7 @@ class TestCompositionTracking:
 
     def test_worklist_mix_no_composition_change(self) -> None:
         A = Labware("solution", 2, 3, min_volume=0, max_volume=1000)
-        A._composition["water"] = 0.25 * np.ones_like(A.volumes)
-        A._composition["salt"] = 0.75 * np.ones_like(A.volumes)
-        A._volumes = np.ones_like(A.volumes) * 500
+        A.add(A.wells, 500, compositions=[dict(water=0.25, salt=0.75)] * 6)
         with EvoWorklist() as wl:
             wl.transfer(A, A.wells, A, A.wells, volumes=300)
         # make sure that the composition of the liquid is not changed
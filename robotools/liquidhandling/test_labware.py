@@ -43,26 +43,32 @@ class TestStandardLabware:
             }
         return
 
-    def test_invalid_init(self) -> None:
+    @pytest.mark.parametrize(
+        "rows,columns,kwargs",
+        [
+            (0, 3, {}),
+            (3, 0, {}),
+            (3, 4, dict(virtual_rows=2)),
+            (1, 4, dict(virtual_rows=0)),
+        ],
+    )
+    def test_invalid_init(self, rows, columns, kwargs) -> None:
         with pytest.raises(ValueError):
-            Labware("A", 0, 3, min_volume=10, max_volume=250)
-        with pytest.raises(ValueError):
-            Labware("A", 3, 0, min_volume=10, max_volume=250)
-        with pytest.raises(ValueError):
-            Labware("A", 3, 4, min_volume=10, max_volume=250, virtual_rows=2)
-        with pytest.raises(ValueError):
-            Labware("A", 1, 4, min_volume=10, max_volume=250, virtual_rows=0)
+            Labware("A", rows, columns, min_volume=10, max_volume=250, **kwargs)
         return
 
-    def test_volume_limits(self) -> None:
-        with pytest.raises(ValueError):
-            Labware("A", 3, 4, min_volume=-30, max_volume=100)
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            dict(min_volume=-30, max_volume=100),
+            dict(min_volume=100, max_volume=70),
+            dict(min_volume=10, max_volume=70, initial_volumes=100),
+            dict(min_volume=10, max_volume=70, initial_volumes=-10),
+        ],
+    )
+    def test_volume_limits(self, kwargs) -> None:
         with pytest.raises(ValueError):
-            Labware("A", 3, 4, min_volume=100, max_volume=70)
-        with pytest.raises(ValueError):
-            Labware("A", 3, 4, min_volume=10, max_volume=70, initial_volumes=100)
-        with pytest.raises(ValueError):
-            Labware("A", 3, 4, min_volume=10, max_volume=70, initial_volumes=-10)
+            Labware("A", 3, 4, **kwargs)
         Labware("A", 3, 4, min_volume=10, max_volume=70, initial_volumes=50)
         return
 
@@ -87,6 +93,79 @@ class TestStandardLabware:
         assert len(plate.history) == 5
         return
 
+    def test_many_wells(self) -> None:
+        plate = Labware("TestPlate", 16, 24, min_volume=0, max_volume=1000)
+        volumes = np.arange(384).reshape(16, 24)
+        plate.add(plate.wells[:, ::-1], volumes)
+        np.testing.assert_array_equal(plate.volumes[:, ::-1], volumes)
+        plate.remove(plate.wells[2:4].flatten(), 1)
+        np.testing.assert_array_equal(plate.volumes[2:4, ::-1], volumes[2:4] - 1)
+        trough = Trough("TestTrough", 8, 12, min_volume=0, max_volume=1000)
+        trough.add(trough.wells, 1)
+        np.testing.assert_array_equal(trough.volumes, np.full((1, 12), 8))
+        # ids that are not wells of the labware
+        with pytest.raises(KeyError):
+            plate.add(["Q01"] + list(plate.wells.flatten()), 0)
+        with pytest.raises(KeyError):
+            plate.add(["A1"] + list(plate.wells.flatten()), 0)
+        with pytest.raises(KeyError):
+            plate.add(list(plate.wells[:2].flatten()) + ["Z99"], 0)
+        return
+
+    def test_more_rows_than_row_ids(self) -> None:
+        plate = Labware("big", 30, 2, min_volume=0, max_volume=100, initial_volumes=1)
+        assert plate.shape == (26, 2)
+        np.testing.assert_array_equal(plate.volumes, np.ones((30, 2)))
+        assert plate.get_well_composition("A01") == {"big.A01": 1}
+        assert plate.get_well_composition("Z02") == {"big.Z02": 1}
+        return
+
+    def test_volumes_snapshot(self) -> None:
+        plate = Labware("TestPlate", 2, 3, min_volume=0, max_volume=250)
+        volumes = plate.volumes
+        plate.add(plate.wells, 5)
+        volumes[0, 0] = 100
+        np.testing.assert_array_equal(volumes, [[100, 0, 0], [0, 0, 0]])
+        np.testing.assert_array_equal(plate.volumes, np.full((2, 3), 5))
+        return
+
+    def test_transaction(self) -> None:
+        plate = Labware("TestPlate", 2, 3, min_volume=0, max_volume=250)
+        with plate.transaction("prepare") as lw:
+            assert lw is plate
+            plate.add(["A01", "B02"], 20, label="first")
+            with plate.transaction("nested"):
+                plate.add("A01", 5)
+            plate.remove("B02", 10)
+            # condensing has nothing to condense within the transaction
+            plate.condense_log(3)
+        assert [label for label, _ in plate.history] == ["initial", "prepare"]
+        np.testing.assert_array_equal(plate.history[-1][1], [[25, 0, 0], [0, 10, 0]])
+
+        # the volumes after a failed operation are logged as well
+        with pytest.raises(VolumeOverflowError):
+            with plate.transaction("failed"):
+                plate.add("A02", 100)
+                plate.add("A02", 200)
+        assert len(plate.history) == 3
+        np.testing.assert_array_equal(plate.history[-1][1], [[25, 100, 0], [0, 10, 0]])
+        return
+
+    def test_long_history(self) -> None:
+        plate = Labware("TestPlate", 2, 3, min_volume=0, max_volume=250)
+        for _ in range(40):
+            plate.add(plate.wells, 5)
+        history = plate.history
+        assert len(history) == 41
+        for i, (_, state) in enumerate(history):
+            np.testing.assert_array_equal(state, np.full((2, 3), 5 * i))
+            assert not state.flags.writeable
+        # snapshots that were handed out are not affected by later operations
+        plate.condense_log(2)
+        plate.remove(plate.wells, 200)
+        np.testing.assert_array_equal(history[-2][1], np.full((2, 3), 195))
+        return
+
     def test_log_condensation_first(self) -> None:
         plate = Labware("TestPlate", 2, 3, min_volume=50, max_volume=250)
         plate.add(plate.wells, 25, label="A")
@@ -171,6 +250,37 @@ class TestStandardLabware:
         assert len(plate.history) == 1
         return
 
+    def test_repeated_wells(self) -> None:
+        plate = Labware("TestPlate", 2, 3, min_volume=50, max_volume=250, initial_volumes=100)
+        plate.add(["A01", "A01", "B02"], [20, 30, 40])
+        plate.remove(["B02", "B02"], [40, 10])
+        np.testing.assert_array_equal(plate.volumes, np.array([[150, 100, 100], [100, 90, 100]]))
+        # the first violation is reported with the volume at that point
+        with pytest.raises(VolumeOverflowError, match=r"A01: 230.0 \+ 30"):
+            plate.add(["A01", "A01", "A01"], [80, 30, 200])
+        with pytest.raises(VolumeUnderflowError, match=r"B02: 60.0 - 20"):
+            plate.remove(["B02", "B02"], [30, 20])
+        assert len(plate.history) == 3
+        return
+
+    def test_single_well(self) -> None:
+        plate = Labware("TestPlate", 2, 3, min_volume=50, max_volume=250, initial_volumes=100)
+        plate.add("B02", 20.5, label="one")
+        plate.remove("B02", 10)
+        np.testing.assert_array_equal(plate.volumes, np.array([[100, 100, 100], [100, 110.5, 100]]))
+        assert [label for label, _ in plate.history] == ["initial", "one", None]
+        # same errors as with arrays of wells
+        with pytest.raises(VolumeOverflowError, match=r"B02: 110.5 \+ 200"):
+            plate.add("B02", 200)
+        with pytest.raises(VolumeUnderflowError, match=r"B02: 110.5 - 100"):
+            plate.remove("B02", 100)
+        with pytest.raises(AssertionError, match="positive"):
+            plate.add("B02", -1)
+        with pytest.raises(KeyError):
+            plate.remove("C01", 1)
+        assert len(plate.history) == 3
+        return
+
 
 class TestTroughLabware:
     def test_warns_on_api(self) -> None:
@@ -241,6 +351,17 @@ class TestTroughLabware:
             }
         return
 
+    def test_positions_beyond_row_ids(self) -> None:
+        trough = Trough("TestTrough", 30, 2, min_volume=0, max_volume=100)
+        assert trough.row_ids == tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+        with pytest.warns(DeprecationWarning, match="in favor of model-specific"):
+            positions = trough.positions
+        assert positions["A01"] == 1
+        assert positions["Z01"] == 26
+        assert positions["A02"] == 31
+        assert positions["Z02"] == 56
+        return
+
     def test_initial_volumes(self) -> None:
         trough = Trough(
             "TestTrough",
@@ -77,6 +77,20 @@ class TestWellRandomizer:
         np.testing.assert_array_equal(randomizer.randomized_wells, ["A02", "A04", "A01", "A03"])
         return
 
+    @pytest.mark.parametrize("mode", ["full", "row", "column"])
+    def test_fast_rng(self, mode) -> None:
+        A = (6, 8)
+        randomizer = WellRandomizer(A, 13, mode=mode, fast_rng=True)
+        assert isinstance(randomizer.rng, np.random.Generator)
+        # still a reproducible one-to-one assignment
+        assert randomizer.lookup == WellRandomizer(A, 13, mode=mode, fast_rng=True).lookup
+        assert sorted(randomizer.lookup.values()) == sorted(randomizer.lookup.keys())
+        original = ["A01", "F02", "A05"]
+        np.testing.assert_array_equal(
+            randomizer.derandomize_wells(randomizer.randomize_wells(original)), original
+        )
+        return
+
     def test_randomize_wells(self) -> None:
         A = (6, 8)
         S = 13
@@ -158,6 +158,9 @@ class TestDilutionPlan:
         )
         assert "Mix column 0 with 75 % of its volume" in dilution.report
         assert "Mix column 1 with 50 % of its volume" in dilution.report
+        # large volume transfers end with a break already, which must not be repeated
+        assert "B;" in wl
+        assert not any(a == b == "B;" for a, b in zip(wl[:-1], wl[1:]))
         return
 
     def test_to_worklist_hooks(self) -> None:
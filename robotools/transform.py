@@ -1,4 +1,5 @@
-from typing import Dict, Literal, Tuple
+import itertools
+from typing import Dict, Literal, Tuple, Union
 
 import numpy
 from numpy.typing import ArrayLike
@@ -46,6 +47,30 @@ def make_well_array(R: int, C: int) -> numpy.ndarray:
     )
 
 
+def _get_indices(
+    indices: Dict[str, Tuple[int, int]], wells: numpy.ndarray
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Looks up the numpy indices of many well IDs at once.
+
+    Parameters
+    ----------
+    indices : dict
+        Mapping of IDs to numpy-style indices
+    wells : ndarray
+        Array of well IDs
+
+    Returns
+    -------
+    rows : ndarray
+        Row indices of the wells
+    columns : ndarray
+        Column indices of the wells
+    """
+    pairs = map(indices.__getitem__, wells.ravel().tolist())
+    idx = numpy.fromiter(itertools.chain.from_iterable(pairs), dtype=int, count=2 * wells.size).reshape(-1, 2)
+    return idx[:, 0], idx[:, 1]
+
+
 class WellShifter:
     """Helper object to shift a set of well IDs within a MTP."""
 
@@ -88,14 +113,9 @@ class WellShifter:
         shifted : ndarray
             Array of well ids on B (same shape)
         """
-        wells = numpy.array(wells)
-        wells_shape = wells.shape
-
-        shifted = []
-        for well in wells.flatten():
-            r, c = self.indices_A[well]
-            shifted.append(self.wells_B[r + self.dr, c + self.dc])
-        return numpy.array(shifted).reshape(wells_shape)
+        wells = numpy.asarray(wells)
+        r, c = _get_indices(self.indices_A, wells)
+        return self.wells_B[r + self.dr, c + self.dc].reshape(wells.shape)
 
     def unshift(self, wells: ArrayLike) -> numpy.ndarray:
         """Apply the reverse-transformation.
@@ -110,14 +130,9 @@ class WellShifter:
         original : ndarray
             Array of well ids on A (same shape)
         """
-        wells = numpy.array(wells)
-        wells_shape = wells.shape
-
-        shifted = []
-        for well in wells.flatten():
-            r, c = self.indices_B[well]
-            shifted.append(self.wells_A[r - self.dr, c - self.dc])
-        return numpy.array(shifted).reshape(wells_shape)
+        wells = numpy.asarray(wells)
+        r, c = _get_indices(self.indices_B, wells)
+        return self.wells_A[r - self.dr, c - self.dc].reshape(wells.shape)
 
 
 class WellRotator:
@@ -152,14 +167,9 @@ class WellRotator:
         rotated : ndarray
             Array of well ids
         """
-        wells = numpy.array(wells)
-        wells_shape = wells.shape
-
-        rotated = []
-        for well in wells.flatten():
-            r, c = self.original_indices[well]
-            rotated.append(self.rotated_wells[self.original_shape[1] - c - 1, r])
-        return numpy.array(rotated).reshape(wells_shape)
+        wells = numpy.asarray(wells)
+        r, c = _get_indices(self.original_indices, wells)
+        return self.rotated_wells[self.original_shape[1] - c - 1, r].reshape(wells.shape)
 
     def rotate_cw(self, wells: ArrayLike) -> numpy.ndarray:
         """Rotate the given wells clockwise.
@@ -174,14 +184,9 @@ class WellRotator:
         rotated : ndarray
             Array of well ids
         """
-        wells = numpy.array(wells)
-        wells_shape = wells.shape
-
-        rotated = []
-        for well in wells.flatten():
-            r, c = self.original_indices[well]
-            rotated.append(self.rotated_wells[c, self.original_shape[0] - r - 1])
-        return numpy.array(rotated).reshape(wells_shape)
+        wells = numpy.asarray(wells)
+        r, c = _get_indices(self.original_indices, wells)
+        return self.rotated_wells[c, self.original_shape[0] - r - 1].reshape(wells.shape)
 
 
 class WellRandomizer:
@@ -193,6 +198,7 @@ class WellRandomizer:
         random_seed: int,
         *,
         mode: Literal["full", "row", "column"] = "full",
+        fast_rng: bool = False,
     ) -> None:
         """Create a helper object for randomizing wells.
 
@@ -206,10 +212,19 @@ class WellRandomizer:
             To switch between `"full"` randomization,
             or randomization only within each `"row"`,
             or randomization only within each `"column"`.
+        fast_rng
+            If ``True``, the permutations are drawn from a PCG64 ``numpy.random.Generator``
+            which is considerably faster to seed than the legacy ``RandomState``.
+            This is a different random stream, so the layout for a given `random_seed`
+            differs from the one of the default ``fast_rng=False``.
         """
         self.original_shape = original_shape
         self.random_seed = random_seed
-        self.rng = numpy.random.RandomState(self.random_seed)
+        self.rng: Union[numpy.random.RandomState, numpy.random.Generator]
+        if fast_rng:
+            self.rng = numpy.random.default_rng(self.random_seed)
+        else:
+            self.rng = numpy.random.RandomState(self.random_seed)
         self.lookup: Dict[str, str] = {}
         full = make_well_array(*self.original_shape)
         if mode == "full":
@@ -248,12 +263,11 @@ class WellRandomizer:
         randomized : ndarray
             Array of well ids
         """
+        input_wells = numpy.asarray(wells)
+        # both directions of the assignment are precomputed lookups
+        randomized_output_wells = list(map(self.lookup.get, input_wells.ravel().tolist()))
 
-        input_wells = numpy.array(wells)
-        wells_shape = input_wells.shape
-        randomized_output_wells = [self.lookup.get(well) for well in input_wells]
-
-        return numpy.array(randomized_output_wells).reshape(wells_shape)
+        return numpy.array(randomized_output_wells).reshape(input_wells.shape)
 
     def derandomize_wells(self, wells: ArrayLike) -> numpy.ndarray:
         """Derandomize the given wells with the random state and assignment specified in __init__.
@@ -268,8 +282,7 @@ class WellRandomizer:
         derandomized_output_wells : ndarray
             Array of well ids
         """
-        input_wells = numpy.array(wells)
-        wells_shape = input_wells.shape
-        derandomized_output_wells = [self.lookup_reverse.get(well) for well in input_wells]
+        input_wells = numpy.asarray(wells)
+        derandomized_output_wells = list(map(self.lookup_reverse.get, input_wells.ravel().tolist()))
 
-        return numpy.array(derandomized_output_wells).reshape(wells_shape)
+        return numpy.array(derandomized_output_wells).reshape(input_wells.shape)
@@ -29,15 +29,24 @@ def get_trough_wells(n: int, trough_wells: Union[collections.abc.Iterable[str],
         raise TypeError("n must be int")
     if n < 0:
         raise ValueError("n must be ≥ 0.")
-    trough_wells = list(numpy.asarray(trough_wells).flatten("F"))
+    trough_wells = numpy.asarray(trough_wells).flatten("F").tolist()
     n_available = len(trough_wells)
     if n_available == 0:
         raise ValueError("trough_wells must contain at least 1 element.")
 
-    n_repeat = n // n_available + 1
+    # repeat the list just often enough
+    n_repeat = -(-n // n_available)
     return (trough_wells * n_repeat)[:n]
 
 
+def _commit(worklist: BaseWorklist) -> None:
+    """Inserts a break, unless the worklist did not grow since the last break."""
+    if worklist and worklist[-1] == "B;":
+        return
+    worklist.commit()
+    return
+
+
 class DilutionPlan:
     """Represents the result of a dilution series planning."""
 
@@ -101,30 +110,32 @@ class DilutionPlan:
         actual_targets = []
 
         # transfer from stock until the volume is too low
-        for c in range(C):
-            vtransfer = numpy.round(vmax_arr[c] * ideal_targets[:, c] / stock, 0)
-            if all(vtransfer >= min_transfer):
-                instructions.append((c, 0, "stock", vtransfer))
-                # compute the actually achieved target concentration
-                actual_targets.append(vtransfer / vmax_arr[c] * stock)
-            else:
-                break
+        v_from_stock = numpy.round(vmax_arr * ideal_targets / stock, 0)
+        (too_low,) = numpy.nonzero(~numpy.all(v_from_stock >= min_transfer, axis=0))
+        for c in range(too_low[0] if len(too_low) else C):
+            vtransfer = v_from_stock[:, c]
+            instructions.append((c, 0, "stock", vtransfer))
+            # compute the actually achieved target concentration
+            actual_targets.append(vtransfer / vmax_arr[c] * stock)
 
         # prepare remaining columns by diluting existing ones
         for c in range(len(instructions), C):
-            # find the first source column that can be used (with sufficient transfer volume)
-            for src_c in range(0, len(instructions)):
+            # transfer volumes from all source columns that were prepared so far
+            v_from_columns = numpy.ceil(
+                (vmax_arr[c] * ideal_targets[:, c])[:, None] / numpy.transpose(actual_targets)
+            )
+            # take the leftmost column (least dilution steps) where the minimal transfer volume is exceeded
+            (sufficient,) = numpy.nonzero(numpy.all(v_from_columns >= min_transfer, axis=0))
+            if len(sufficient):
+                src_c = int(sufficient[0])
                 _, src_df, _, _ = instructions[src_c]
-                vtransfer = numpy.ceil(vmax_arr[c] * ideal_targets[:, c] / actual_targets[src_c])
-                # take the leftmost column (least dilution steps) where the minimal transfer volume is exceeded
-                if all(vtransfer >= min_transfer):
-                    instructions.append(
-                        # increment the dilution step counter
-                        (c, src_df + 1, src_c, vtransfer)
-                    )
-                    # compute the actually achieved target concentration
-                    actual_targets.append(vtransfer * actual_targets[src_c] / vmax_arr[c])
-                    break
+                vtransfer = v_from_columns[:, src_c]
+                instructions.append(
+                    # increment the dilution step counter
+                    (c, src_df + 1, src_c, vtransfer)
+                )
+                # compute the actually achieved target concentration
+                actual_targets.append(vtransfer * actual_targets[src_c] / vmax_arr[c])
 
         if len(actual_targets) < C:
             message = (
@@ -296,7 +307,7 @@ class DilutionPlan:
                     liquid_class=lc_stock_trough,
                     label=f"Distribute from stock",
                 )
-                worklist.commit()
+                _commit(worklist)
             else:
                 # transfers for serial dilution are done after the mixing step
                 # at this point this has already happened
@@ -314,7 +325,7 @@ class DilutionPlan:
                 liquid_class=lc_diluent_trough,
                 label=f"Dilute column {col}",
             )
-            worklist.commit()
+            _commit(worklist)
 
             if callable(pre_mix_hook):
                 new_wl = pre_mix_hook(col, worklist)
@@ -336,7 +347,7 @@ class DilutionPlan:
                         wash_scheme=mix_wash if r < mix_repeat - 1 else 1,
                         label=f"Mix column {col} with {mix_fraction*100:.0f} % of its volume",
                     )
-                    worklist.commit()
+                    _commit(worklist)
 
             if callable(post_mix_hook):
                 new_wl = post_mix_hook(col, worklist)
@@ -354,7 +365,7 @@ class DilutionPlan:
                     liquid_class=lc_transfer,
                     label=f"Transfer columns {col} -> {dst} for later dilution step",
                 )
-                worklist.commit()
+                _commit(worklist)
 
             # transfer to a destination is optional
             if destination_plate:
@@ -367,6 +378,6 @@ class DilutionPlan:
                     liquid_class=lc_transfer,
                     label=f"Transfer column {col} to the destination plate",
                 )
-                worklist.commit()
+                _commit(worklist)
 
         return
@@ -3,7 +3,7 @@
 import logging
 import math
 from pathlib import Path
-from typing import Dict, Iterable, List, Literal, Optional, Sequence, Union
+from typing import Dict, Iterable, List, Literal, Optional, Sequence, Tuple, Union
 
 import numpy
 
@@ -11,16 +11,27 @@ from robotools import liquidhandling
 from robotools.evotools.types import Tip
 from robotools.liquidhandling import Labware
 from robotools.worklists.exceptions import CompatibilityError, InvalidOperationError
-from robotools.worklists.utils import prepare_aspirate_dispense_parameters
+from robotools.worklists.utils import (
+    optimize_partition_by,
+    partition_by_column,
+    partition_volumes,
+    prepare_aspirate_dispense_parameters,
+    prepare_volume,
+)
 
 __all__ = ("BaseWorklist",)
 
 logger = logging.getLogger(__name__)
 
+_WASH_RECORDS = {scheme: f"W{scheme};" for scheme in (1, 2, 3, 4)}
+"""Wash records by scheme, shared by all worklists to avoid duplicate string objects."""
+
 
 class BaseWorklist(list):
     """Context manager for the creation of Worklists."""
 
+    __slots__ = ("_filepath", "max_volume", "auto_split", "diti_mode")
+
     def __init__(
         self,
         filepath: Optional[Union[str, Path]] = None,
@@ -118,14 +129,17 @@ class BaseWorklist(list):
         scheme : int
             Number indicating the wash scheme (default: 1)
         """
+        self.append(self._wash_record(scheme))
+        return
+
+    def _wash_record(self, scheme: int) -> str:
+        """Internal method to create the record of a wash with the given scheme."""
         if self.diti_mode:
-            self.append("W;")
-            return
+            return "W;"
 
-        if not scheme in {1, 2, 3, 4}:
+        if not scheme in _WASH_RECORDS:
             raise ValueError("scheme must be either 1, 2, 3 or 4")
-        self.append(f"W{scheme};")
-        return
+        return _WASH_RECORDS[scheme]
 
     def decontaminate(self) -> None:
         """Decontamination wash consists of a decontamination wash followed by a normal wash."""
@@ -153,6 +167,9 @@ class BaseWorklist(list):
         commands without waiting. You can use the Break record e.g. to create a
         worklist which pipettes using only one tip at a time (even if you chose
         more than one tip in the tip selection).
+
+        The break is only recorded in memory like all other records.
+        Nothing is written to disk before `save` is called or the context manager exits.
         """
         self.append("B;")
         return
@@ -223,31 +240,19 @@ class BaseWorklist(list):
         forced_rack_type : str, optional
             Overrides rack_type from worktable
         """
-        (
-            rack_label,
-            position,
-            volume_s,
-            liquid_class,
-            tip,
-            rack_id,
-            tube_id,
-            rack_type,
-            forced_rack_type,
-        ) = prepare_aspirate_dispense_parameters(
-            rack_label,
-            position,
-            volume,
-            liquid_class,
-            tip,
-            rack_id,
-            tube_id,
-            rack_type,
-            forced_rack_type,
-            max_volume=self.max_volume,
-        )
-        tip_type = ""
-        self.append(
-            f"A;{rack_label};{rack_id};{rack_type};{position};{tube_id};{volume_s};{liquid_class};{tip_type};{tip};{forced_rack_type}"
+        self.extend(
+            self._single_tip_records(
+                "A",
+                rack_label,
+                [position],
+                [volume],
+                liquid_class=liquid_class,
+                tip=tip,
+                rack_id=rack_id,
+                tube_id=tube_id,
+                rack_type=rack_type,
+                forced_rack_type=forced_rack_type,
+            )
         )
         return
 
@@ -291,31 +296,19 @@ class BaseWorklist(list):
         forced_rack_type : str, optional
             Overrides rack_type from worktable
         """
-        (
-            rack_label,
-            position,
-            volume_s,
-            liquid_class,
-            tipv,
-            rack_id,
-            tube_id,
-            rack_type,
-            forced_rack_type,
-        ) = prepare_aspirate_dispense_parameters(
-            rack_label,
-            position,
-            volume,
-            liquid_class,
-            tip,
-            rack_id,
-            tube_id,
-            rack_type,
-            forced_rack_type,
-            max_volume=self.max_volume,
-        )
-        tip_type = ""
-        self.append(
-            f"D;{rack_label};{rack_id};{rack_type};{position};{tube_id};{volume_s};{liquid_class};{tip_type};{tipv};{forced_rack_type}"
+        self.extend(
+            self._single_tip_records(
+                "D",
+                rack_label,
+                [position],
+                [volume],
+                liquid_class=liquid_class,
+                tip=tip,
+                rack_id=rack_id,
+                tube_id=tube_id,
+                rack_type=rack_type,
+                forced_rack_type=forced_rack_type,
+            )
         )
         return
 
@@ -473,9 +466,9 @@ class BaseWorklist(list):
             volumes = numpy.repeat(volumes, len(wells))
         labware.remove(wells, volumes, label)
         self.comment(label)
-        for well, volume in zip(wells, volumes):
-            if volume > 0:
-                self.aspirate_well(labware.name, self._get_well_position(labware, well), volume, **kwargs)
+        has_volume = volumes > 0
+        positions = [self._get_well_position(labware, well) for well in wells[has_volume]]
+        self.extend(self._single_tip_records("A", labware.name, positions, volumes[has_volume], **kwargs))
         return
 
     def dispense(
@@ -513,11 +506,245 @@ class BaseWorklist(list):
             volumes = numpy.repeat(volumes, len(wells))
         labware.add(wells, volumes, label, compositions=compositions)
         self.comment(label)
-        for well, volume in zip(wells, volumes):
-            if volume > 0:
-                self.dispense_well(labware.name, self._get_well_position(labware, well), volume, **kwargs)
+        has_volume = volumes > 0
+        positions = [self._get_well_position(labware, well) for well in wells[has_volume]]
+        self.extend(self._single_tip_records("D", labware.name, positions, volumes[has_volume], **kwargs))
+        return
+
+    def _single_tip_records(
+        self,
+        record_type: Literal["A", "D"],
+        rack_label: str,
+        positions: Sequence[int],
+        volumes: Union[Sequence[float], numpy.ndarray],
+        *,
+        volume_strings: Optional[Sequence[str]] = None,
+        **kwargs,
+    ) -> List[str]:
+        """Validates the parameters of aspirate or dispense records with a single tip and formats them.
+
+        Parameters
+        ----------
+        record_type : str
+            "A" for aspirate or "D" for dispense records
+        rack_label : str
+            User-defined labware name (max 32 characters)
+        positions : list
+            Numbers of the wells
+        volumes : list
+            Volumes in microliters (will be rounded to 2 decimal places)
+        volume_strings : list, optional
+            The `volumes` as already validated and formatted by `prepare_volume`.
+        kwargs
+            Additional keyword arguments of `aspirate_well` and `dispense_well`.
+
+        Returns
+        -------
+        records : list
+            One record per well
+        """
+        if len(positions) == 0:
+            return []
+        # the parameters that are shared by all records are validated only once
+        (
+            rack_label,
+            _,
+            _,
+            liquid_class,
+            tip,
+            rack_id,
+            tube_id,
+            rack_type,
+            forced_rack_type,
+        ) = prepare_aspirate_dispense_parameters(
+            rack_label, positions[0], volumes[0], max_volume=self.max_volume, **kwargs
+        )
+        tip_type = ""
+        # pre-bind the fixed fields, so that only position and volume are formatted per record
+        prefix = f"{record_type};{rack_label};{rack_id};{rack_type};"
+        infix = f";{tube_id};"
+        suffix = f";{liquid_class};{tip_type};{tip};{forced_rack_type}"
+        if volume_strings is None:
+            volume_strings = [prepare_volume(volume, max_volume=self.max_volume) for volume in volumes]
+        return [
+            f"{prefix}{position}{infix}{volume_s}{suffix}"
+            for position, volume_s in zip(positions, volume_strings)
+        ]
+
+    def _transfer_partitioned(
+        self,
+        source: liquidhandling.Labware,
+        source_wells: numpy.ndarray,
+        destination: liquidhandling.Labware,
+        destination_wells: numpy.ndarray,
+        volumes: numpy.ndarray,
+        *,
+        label: Optional[str],
+        wash_scheme: Literal[1, 2, 3, 4, "flush", "reuse"],
+        partition_by: str,
+        **kwargs,
+    ) -> None:
+        """Performs the steps of a transfer column by column, splitting large volumes if enabled.
+
+        Parameters
+        ----------
+        source : liquidhandling.Labware
+            Source labware
+        source_wells : numpy.ndarray
+            Source well ids of all steps
+        destination : liquidhandling.Labware
+            Destination labware
+        destination_wells : numpy.ndarray
+            Destination well ids of all steps
+        volumes : numpy.ndarray
+            Volumes of all steps
+        label : str
+            Label of the operation to log into labware history
+        wash_scheme
+            Wash scheme to apply after every step.
+        partition_by : str
+            one of 'auto', 'source' or 'destination'
+        kwargs
+            Additional keyword arguments of `aspirate_well` and `dispense_well`.
+        """
+        # rows without a positive volume never result in pipetting steps
+        mask = volumes > 0
+        source_wells = source_wells[mask]
+        destination_wells = destination_wells[mask]
+        volumes = volumes[mask]
+
+        # automatic partitioning
+        partition_by = optimize_partition_by(source, destination, partition_by, label)
+
+        # the label applies to the entire transfer operation and is not logged at individual aspirate/dispense steps
+        self.comment(label)
+        if len(volumes) == 0:
+            # there are no steps, and therefore no history entries to condense
+            return
+        nlogs = 0
+        lvh_extra = 0
+        for column in partition_by_column(source_wells, destination_wells, volumes, partition_by):
+            srcs, dsts, vols = map(numpy.asarray, column)
+            # make vector of volumes into a zero-padded (npartitions, nrows) matrix of volume-fractions
+            if self.auto_split:
+                vol_matrix = partition_volumes(vols, max_volume=self.max_volume)
+            else:
+                vol_matrix = numpy.atleast_2d(vols)
+            # transfer from this source column until all wells are done
+            npartitions = len(vol_matrix)
+            # Count only the extra steps created by LVH
+            lvh_extra += int(numpy.count_nonzero(vol_matrix)) - len(vols)
+            # the leading partitions have a volume-fraction for every row
+            is_full = numpy.all(vol_matrix, axis=1)
+            for p, vols_p in enumerate(vol_matrix):
+                # transfer the next volume-fraction of all rows that have one
+                if is_full[p]:
+                    srcs_p, dsts_p = srcs, dsts
+                else:
+                    has_step = vols_p > 0
+                    srcs_p, dsts_p, vols_p = srcs[has_step], dsts[has_step], vols_p[has_step]
+                nlogs += self._transfer_steps(
+                    source,
+                    srcs_p,
+                    destination,
+                    dsts_p,
+                    vols_p,
+                    wash_scheme=wash_scheme,
+                    **kwargs,
+                )
+                naccessed = len(vols_p)
+                # LVH: if multiple wells are accessed, don't group across partitions
+                if npartitions > 1 and naccessed > 1 and not p == npartitions - 1:
+                    self.commit()
+            # LVH: don't group across columns
+            if npartitions > 1:
+                self.commit()
+
+        # Condense the labware logs into one operation
+        # after the transfer operation completed to facilitate debugging.
+        # Also include the number of extra steps because of LVH if applicable.
+        if lvh_extra:
+            if label:
+                label = f"{label} ({lvh_extra} LVH steps)"
+            else:
+                label = f"{lvh_extra} LVH steps"
+        source.condense_log(nlogs, label=label)
+        if destination != source:
+            destination.condense_log(nlogs, label=label)
         return
 
+    def _transfer_steps(
+        self,
+        source: liquidhandling.Labware,
+        source_wells: Union[Sequence[str], numpy.ndarray],
+        destination: liquidhandling.Labware,
+        destination_wells: Union[Sequence[str], numpy.ndarray],
+        volumes: Union[Sequence[float], numpy.ndarray],
+        *,
+        wash_scheme: Literal[1, 2, 3, 4, "flush", "reuse"],
+        **kwargs,
+    ) -> int:
+        """Performs a batch of single-tip transfer steps, each followed by the wash scheme.
+
+        The volume tracking of the batch is done with one ``remove``/``add`` per labware,
+        after the records of all steps were validated.
+
+        Parameters
+        ----------
+        source : liquidhandling.Labware
+            Source labware
+        source_wells : list
+            Source well ids of the steps
+        destination : liquidhandling.Labware
+            Destination labware
+        destination_wells : list
+            Destination well ids of the steps
+        volumes : list
+            Positive volumes of the steps
+        wash_scheme
+            Wash scheme to apply after every step.
+        kwargs
+            Additional keyword arguments of `aspirate_well` and `dispense_well`.
+
+        Returns
+        -------
+        nlogs : int
+            Number of history entries that were logged into each of the labwares.
+        """
+        if destination == source and len(volumes) > 1:
+            # steps can depend on the outcome of preceding steps in the same labware
+            return sum(
+                self._transfer_steps(source, [s], destination, [d], [v], wash_scheme=wash_scheme, **kwargs)
+                for s, d, v in zip(source_wells, destination_wells, volumes)
+            )
+
+        # the same record is appended after every step
+        wash_records: Tuple[str, ...] = ()
+        if wash_scheme == "flush":
+            wash_records = ("F;",)
+        elif wash_scheme != "reuse":
+            wash_records = (self._wash_record(wash_scheme),)
+
+        src_positions = [self._get_well_position(source, s) for s in source_wells]
+        dst_positions = [self._get_well_position(destination, d) for d in destination_wells]
+
+        # aspirate and dispense records share the formatted volumes
+        volume_strings = [prepare_volume(v, max_volume=self.max_volume) for v in volumes]
+        aspirates = self._single_tip_records(
+            "A", source.name, src_positions, volumes, volume_strings=volume_strings, **kwargs
+        )
+        dispenses = self._single_tip_records(
+            "D", destination.name, dst_positions, volumes, volume_strings=volume_strings, **kwargs
+        )
+        records = [record for step in zip(aspirates, dispenses) for record in (*step, *wash_records)]
+
+        # the labwares are changed only after all records are valid
+        compositions = source.get_well_compositions(source_wells)
+        source.remove(source_wells, volumes, label=None)
+        destination.add(destination_wells, volumes, label=None, compositions=compositions)
+        self.extend(records)
+        return 2 if destination == source else 1
+
     def transfer(
         self,
         source: liquidhandling.Labware,
@@ -14,6 +14,7 @@ from robotools.worklists.exceptions import CompatibilityError, InvalidOperationE
 from robotools.worklists.utils import (
     partition_by_column,
     partition_volume,
+    partition_volumes,
     prepare_aspirate_dispense_parameters,
 )
 
@@ -353,6 +354,17 @@ class TestWorklist:
             raise error
         return
 
+    def test_save_multiple_lines(self, tmp_path) -> None:
+        fp = tmp_path / "multiple.gwl"
+        with BaseWorklist() as worklist:
+            worklist.comment("First")
+            worklist.flush()
+            worklist.commit()
+            worklist.save(fp)
+        # lines are separated by CRLF without a trailing line break
+        assert fp.read_bytes() == b"C;First\r\nF;\r\nB;"
+        return
+
     def test_autosave(self) -> None:
         tf = tempfile.mktemp() + ".gwl"
         error = None
@@ -567,6 +579,21 @@ class TestStandardLabwareWorklist:
         assert wl[-1] == "D;A;;;1;;10.00;;;73;"
         pass
 
+    def test_failed_transfer_leaves_labware(self, wl_cls) -> None:
+        source = Labware("SourceLW", rows=2, columns=1, min_volume=0, max_volume=5000, initial_volumes=2000)
+        destination = Labware("DestinationLW", rows=2, columns=1, min_volume=0, max_volume=5000)
+        with wl_cls(max_volume=950, auto_split=False) as wl:
+            with pytest.raises(InvalidOperationError, match="exceeds max_volume"):
+                wl.transfer(source, source.wells, destination, destination.wells, [100, 1000])
+            with pytest.raises(ValueError, match="Invalid liquid_class"):
+                wl.transfer(source, source.wells, destination, destination.wells, 100, liquid_class="bad;lc")
+            assert wl == []
+        np.testing.assert_array_equal(source.volumes, [[2000], [2000]])
+        np.testing.assert_array_equal(destination.volumes, [[0], [0]])
+        assert len(source.history) == 1
+        assert len(destination.history) == 1
+        return
+
 
 class TestLargeVolumeHandling:
     def testpartition_volume_helper(self) -> None:
@@ -577,6 +604,23 @@ class TestLargeVolumeHandling:
         assert [667 == 667, 666], partition_volume(2000, max_volume=950)
         return
 
+    def testpartition_volumes_helper(self) -> None:
+        volumes = [0, 550.3, 1000, 999, 2000, 950.5]
+        partitions = partition_volumes(np.array(volumes), max_volume=950)
+        np.testing.assert_array_equal(
+            partitions,
+            [
+                [0, 550.3, 500, 500, 667, 476],
+                [0, 0, 500, 499, 667, 474.5],
+                [0, 0, 0, 0, 666, 0],
+            ],
+        )
+        # same as the partitioning of individual volumes
+        for v, column in zip(volumes, partitions.T):
+            assert list(column[column > 0]) == partition_volume(v, max_volume=950)
+        assert partition_volumes(np.array([]), max_volume=950).shape == (0, 0)
+        return
+
     def test_worklist_constructor(self) -> None:
         with pytest.raises(ValueError):
             with BaseWorklist(max_volume=None) as wl:
@@ -723,6 +767,21 @@ class TestLargeVolumeHandling:
         )
         return
 
+    def testpartition_by_columns_repeated_wells(self) -> None:
+        # steps with the same well keep their original order
+        sources = ["A01"] * 20
+        destinations = [f"{r}{c:02d}" for c in [2, 1] for r in "HGFEDCBAJI"]
+        column_groups = partition_by_column(sources, destinations, list(range(20)), partition_by="source")
+        assert column_groups == [(sources, destinations, list(range(20)))]
+
+        column_groups = partition_by_column(destinations, sources, list(range(20)), partition_by="source")
+        assert [vols for _, _, vols in column_groups] == [
+            [17, 16, 15, 14, 13, 12, 11, 10, 19, 18],
+            [7, 6, 5, 4, 3, 2, 1, 0, 9, 8],
+        ]
+        assert partition_by_column([], [], [], partition_by="destination") == []
+        return
+
 
 class TestReagentDistribution:
     def test_parameter_validation(self, caplog) -> None:
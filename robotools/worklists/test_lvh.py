@@ -77,6 +77,9 @@ class TestLargeVolumeHandling:
                 "W1;",
                 "B;",  # tailing break after partitioning
             ]
+        # The 0 volume of D01 must not reduce the count of extra steps
+        assert "2 LVH steps" in src.report
+        assert "2 LVH steps" in dst.report
         np.testing.assert_array_equal(
             src.volumes,
             [
@@ -1,7 +1,23 @@
 import logging
 
+import numpy as np
+import pytest
+
 from robotools.liquidhandling.labware import Labware, Trough
-from robotools.worklists.utils import optimize_partition_by
+from robotools.worklists.exceptions import InvalidOperationError
+from robotools.worklists.utils import optimize_partition_by, prepare_volume
+
+
+def test_prepare_volume() -> None:
+    assert prepare_volume(15) == "15.00"
+    assert prepare_volume(np.float64(12.345678)) == "12.35"
+    assert prepare_volume("7.5", max_volume=10) == "7.50"
+    for invalid in [None, "A", -1, np.nan, 7158279]:
+        with pytest.raises(ValueError, match="volume"):
+            prepare_volume(invalid)
+    with pytest.raises(InvalidOperationError, match="exceeds max_volume"):
+        prepare_volume(20, max_volume=10)
+    return
 
 
 def test_automatic_partitioning(caplog) -> None:
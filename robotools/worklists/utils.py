@@ -2,7 +2,8 @@
 import collections
 import logging
 import math
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+import string
+from typing import Iterable, List, Optional, Tuple, Union
 
 import numpy
 
@@ -12,15 +13,45 @@ from robotools.worklists.exceptions import InvalidOperationError
 from .. import liquidhandling
 
 __all__ = (
+    "prepare_volume",
     "prepare_aspirate_dispense_parameters",
     "optimize_partition_by",
     "partition_volume",
+    "partition_volumes",
     "partition_by_column",
 )
 
 logger = logging.getLogger(__name__)
 
 
+def prepare_volume(volume: float, max_volume: Optional[Union[int, float]] = None) -> str:
+    """Validates a pipetting volume and formats it for aspirate/dispense records.
+
+    Parameters
+    ----------
+    volume : float
+        Volume in microliters (will be rounded to 2 decimal places)
+    max_volume : int, optional
+        Maximum allowed volume
+
+    Returns
+    -------
+    volume : str
+        Volume in microliters, rounded to 2 decimal places
+    """
+    if volume is None:
+        raise ValueError("Missing required parameter: volume")
+    try:
+        volume = float(volume)
+    except:
+        raise ValueError(f"Invalid volume: {volume}")
+    if volume < 0 or volume > 7158278 or numpy.isnan(volume):
+        raise ValueError(f"Invalid volume: {volume}")
+    if max_volume is not None and volume > max_volume:
+        raise InvalidOperationError(f"Volume of {volume} exceeds max_volume.")
+    return f"{numpy.round(volume, decimals=2):.2f}"
+
+
 def prepare_aspirate_dispense_parameters(
     rack_label: str,
     position: int,
@@ -92,16 +123,7 @@ def prepare_aspirate_dispense_parameters(
     if not isinstance(position, int) or position < 0:
         raise ValueError(f"Invalid position: {position}")
 
-    if volume is None:
-        raise ValueError("Missing required parameter: volume")
-    try:
-        volume = float(volume)
-    except:
-        raise ValueError(f"Invalid volume: {volume}")
-    if volume < 0 or volume > 7158278 or numpy.isnan(volume):
-        raise ValueError(f"Invalid volume: {volume}")
-    if max_volume is not None and volume > max_volume:
-        raise InvalidOperationError(f"Volume of {volume} exceeds max_volume.")
+    volume_str = prepare_volume(volume, max_volume)
 
     # optional parameters
     if not isinstance(liquid_class, str) or ";" in liquid_class:
@@ -137,8 +159,7 @@ def prepare_aspirate_dispense_parameters(
     if not isinstance(forced_rack_type, str) or len(forced_rack_type) > 32 or ";" in forced_rack_type:
         raise ValueError(f"Invalid forced_rack_type: {forced_rack_type}")
 
-    # apply rounding and corrections for the right string formatting
-    volume_str = f"{numpy.round(volume, decimals=2):.2f}"
+    # apply corrections for the right string formatting
     tip = "" if tip == -1 else tip
     return rack_label, position, volume_str, liquid_class, tip, rack_id, tube_id, rack_type, forced_rack_type
 
@@ -212,10 +233,41 @@ def partition_volume(volume: float, *, max_volume: Union[int, float]) -> List[fl
     isteps = math.ceil(volume / max_volume)
     step_volume = math.ceil(volume / isteps)
     volumes: List[float] = [step_volume] * (isteps - 1)
-    volumes.append(volume - numpy.sum(volumes))
+    volumes.append(volume - step_volume * (isteps - 1))
     return volumes
 
 
+def partition_volumes(volumes: numpy.ndarray, *, max_volume: Union[int, float]) -> numpy.ndarray:
+    """Partitions many pipetting volumes like `partition_volume`, but into a zero-padded matrix.
+
+    Parameters
+    ----------
+    volumes : numpy.ndarray
+        Vector of non-negative volumes to partition
+    max_volume : int
+        Maximum volume of a pipetting step
+
+    Returns
+    -------
+    partitions : numpy.ndarray
+        (npartitions, len(volumes)) matrix of partitioned volumes.
+        Column ``i`` starts with the partitions of ``volumes[i]`` and is padded with zeros.
+    """
+    volumes = numpy.asarray(volumes, dtype=float)
+    # number of pipetting steps per volume
+    isteps = numpy.where(volumes < max_volume, 1, numpy.ceil(volumes / max_volume)).astype(int)
+    isteps[volumes == 0] = 0
+    step_volumes = numpy.where(isteps > 1, numpy.ceil(volumes / numpy.maximum(isteps, 1)), volumes)
+
+    npartitions = int(isteps.max(initial=0))
+    p = numpy.arange(npartitions)[:, None]
+    partitions = numpy.where(p < isteps - 1, step_volumes, 0.0)
+    # the last step of each volume transfers the remainder
+    (i,) = numpy.nonzero(isteps)
+    partitions[isteps[i] - 1, i] = volumes[i] - step_volumes[i] * (isteps[i] - 1)
+    return partitions
+
+
 def partition_by_column(
     sources: Iterable[str],
     destinations: Iterable[str],
@@ -240,33 +292,29 @@ def partition_by_column(
     column_groups : list
         A list of (sources, destinations, volumes)
     """
-    # first partition the wells into columns
-    column_groups_dd: Dict[str, Tuple[List[str], List[str], List[float]]] = collections.defaultdict(
-        lambda: ([], [], [])
-    )
-    for s, d, v in zip(sources, destinations, volumes):
-        if partition_by == "source":
-            group = s[1:]
-        elif partition_by == "destination":
-            group = d[1:]
-        else:
-            raise ValueError(f'Invalid `partition_by` parameter "{partition_by}""')
-        column_groups_dd[group][0].append(s)
-        column_groups_dd[group][1].append(d)
-        column_groups_dd[group][2].append(v)
-    # bring columns in the right order
-    column_groups = [column_groups_dd[col] for col in sorted(column_groups_dd.keys())]
-    # sort the rows within the column
-    for c, (srcs, dsts, vols) in enumerate(column_groups):
-        if partition_by == "source":
-            order = numpy.argsort(srcs)
-        elif partition_by == "destination":
-            order = numpy.argsort(dsts)
-        else:
-            raise ValueError(f'Invalid `partition_by` parameter "{partition_by}""')
-        column_groups[c] = (
-            list(numpy.array(srcs)[order]),
-            list(numpy.array(dsts)[order]),
-            list(numpy.array(vols)[order]),
+    sources = numpy.asarray(sources)
+    destinations = numpy.asarray(destinations)
+    volumes = numpy.asarray(volumes)
+    if partition_by == "source":
+        wells = sources
+    elif partition_by == "destination":
+        wells = destinations
+    else:
+        raise ValueError(f'Invalid `partition_by` parameter "{partition_by}""')
+    if len(wells) == 0:
+        return []
+    # sort by the column and then by the row within the column
+    columns = numpy.char.lstrip(wells, string.ascii_letters)
+    order = numpy.lexsort((wells, columns))
+    _, starts = numpy.unique(columns[order], return_index=True)
+    column_groups = []
+    for start, stop in zip(starts, [*starts[1:], len(order)]):
+        group = order[start:stop]
+        column_groups.append(
+            (
+                sources[group].tolist(),
+                destinations[group].tolist(),
+                volumes[group].tolist(),
+            )
         )
     return column_groups